@@ -3,17 +3,23 @@
 Run with:
     python app.py
 Then open http://127.0.0.1:8050/ in a browser.
+
+For deployment, serve the Flask app under Gunicorn with preloading so the
+data and figures are built once and shared by the forked workers:
+    gunicorn --preload --workers 4 --worker-class gthread --threads 4 app:server
 """
 from __future__ import annotations
 
+import os
+import tempfile
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from dash import Dash, Input, Output, dcc, html
+from dash import Dash, Input, Output, State, dcc, html
 
 DATA_PATH = Path(__file__).resolve().parent / "walmart_sales.csv"
 
@@ -27,38 +33,131 @@ HOLIDAY_DATES: Dict[str, List[str]] = {
 
 
 def load_data(path: Path = DATA_PATH) -> pd.DataFrame:
-    """Load and clean the Walmart weekly sales data."""
-    df = pd.read_csv(path)
+    """Load and clean the Walmart weekly sales data.
+
+    The cleaned frame is cached next to the CSV as Parquet and reused until
+    either the CSV or this module changes.
+    """
+    cache = path.with_suffix(".parquet")
+    source_mtime = max(path.stat().st_mtime, Path(__file__).stat().st_mtime)
+    if cache.exists() and cache.stat().st_mtime >= source_mtime:
+        try:
+            return pd.read_parquet(cache)
+        except (OSError, ValueError):
+            pass  # unreadable cache: rebuild it from the CSV below
+
+    df = pd.read_csv(path, engine="pyarrow")
     df["Date"] = pd.to_datetime(df["Date"], format="%d-%m-%Y")
+    # Only runs on a cache miss. A single two-key sort measured faster here
+    # than chained stable single-key sorts or an is-sorted pre-check.
     df = df.sort_values(["Store", "Date"]).reset_index(drop=True)
     df["Weekly_Sales"] = df["Weekly_Sales"].round(2)
     df["Temperature"] = df["Temperature"].round().astype(int)
     df["Fuel_Price"] = df["Fuel_Price"].round(2)
     df["CPI"] = df["CPI"].round(3)
     df["Unemployment"] = df["Unemployment"].round(3)
-    df["Is_Holiday_Week"] = np.where(df["Holiday_Flag"] == 1, "Holiday Weeks", "Non-Holiday Weeks")
+    df["Is_Holiday_Week"] = pd.Categorical.from_codes(
+        df["Holiday_Flag"].to_numpy(), categories=["Non-Holiday Weeks", "Holiday Weeks"]
+    )
 
-    holiday_lookup = {
-        pd.to_datetime(date): name  # keep datetime objects for fast map
-        for name, dates in HOLIDAY_DATES.items()
-        for date in dates
-    }
+    # Parse all holiday dates in one NumPy call; mapping through a Series
+    # uses a hash-table lookup instead of a per-row Python dict call.
+    holiday_dates = np.array(
+        [date for dates in HOLIDAY_DATES.values() for date in dates], dtype="datetime64[D]"
+    ).astype("datetime64[ns]")
+    holiday_lookup = pd.Series(
+        [name for name, dates in HOLIDAY_DATES.items() for _ in dates],
+        index=holiday_dates,
+    )
     df["Holiday_Name"] = df["Date"].map(holiday_lookup)
+
+    # Narrow dtypes once cleaning is done. Weekly_Sales stays float64: values
+    # reach ~3.8M, where float32 can no longer hold the cents.
+    df = df.astype(
+        {
+            "Store": "uint16",
+            "Holiday_Flag": "uint8",
+            "Temperature": "int16",
+            "Fuel_Price": "float32",
+            "CPI": "float32",
+            "Unemployment": "float32",
+        }
+    )
+
+    _write_cache(df, cache)
     return df
 
 
+def _write_cache(df: pd.DataFrame, cache: Path) -> None:
+    """Atomically write the Parquet cache; skip it if the directory is read-only."""
+    try:
+        fd, tmp_name = tempfile.mkstemp(dir=cache.parent, prefix=f"{cache.name}.", suffix=".tmp")
+    except OSError:
+        return
+    os.close(fd)
+    try:
+        df.to_parquet(tmp_name, index=False, compression="zstd")
+        os.replace(tmp_name, cache)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
+
+
 analysis_df = load_data()
 
+# Row subsets behind the CPI filter, split once rather than on every click.
+_HOLIDAY_SUBSET = analysis_df[analysis_df["Holiday_Flag"] == 1]
+_NONHOL_SUBSET = analysis_df[analysis_df["Holiday_Flag"] == 0]
+_CPI_SUBSETS: Dict[str, pd.DataFrame] = {
+    "holiday": _HOLIDAY_SUBSET,
+    "non_holiday": _NONHOL_SUBSET,
+    "all": analysis_df,
+}
+
+# Cap the points sent to the browser for the CPI scatter. Larger subsets are
+# sampled per Holiday_Flag so both week types keep their share; the trendline
+# is still fitted on the full subset.
+_CPI_MAX_POINTS = 3000
+
+
+def _sample_for_plot(subset: pd.DataFrame, max_points: int = _CPI_MAX_POINTS) -> pd.DataFrame:
+    if len(subset) <= max_points:
+        return subset
+    return subset.groupby("Holiday_Flag", group_keys=False).sample(
+        frac=max_points / len(subset), random_state=0
+    )
+
+
+_CPI_SAMPLES: Dict[str, pd.DataFrame] = {
+    flag: _sample_for_plot(subset) for flag, subset in _CPI_SUBSETS.items()
+}
+# Linear trend (coefficients, CPI min, CPI max) per filter, fitted on the
+# full subset once so the callback only assembles the figure.
+_TRENDS: Dict[str, Tuple[np.ndarray, float, float]] = {
+    flag: (
+        np.polyfit(subset["CPI"].to_numpy(), subset["Weekly_Sales"].to_numpy(), 1),
+        subset["CPI"].min(),
+        subset["CPI"].max(),
+    )
+    for flag, subset in _CPI_SUBSETS.items()
+    if not subset.empty
+}
+_CPI_TITLES: Dict[str, str] = {
+    "holiday": "Holiday Weeks",
+    "non_holiday": "Non-Holiday Weeks",
+    "all": "All Weeks",
+}
+
 holiday_sales = (
-    analysis_df[analysis_df["Holiday_Flag"] == 1]
+    _HOLIDAY_SUBSET[["Holiday_Name", "Weekly_Sales"]]
     .assign(Holiday_Name=lambda d: d["Holiday_Name"].fillna("Other Holiday"))
-    .groupby("Holiday_Name", as_index=False)["Weekly_Sales"]
+    .groupby("Holiday_Name", as_index=False, sort=False)["Weekly_Sales"]
     .agg(average_sales="mean", median_sales="median", observations="count")
     .sort_values("average_sales", ascending=False)
 )
 
 store_stats = (
-    analysis_df.groupby("Store")
+    analysis_df[["Store", "Unemployment", "Weekly_Sales", "CPI"]]
+    .groupby("Store", sort=False)
     .agg(
         avg_unemployment=("Unemployment", "mean"),
         avg_weekly_sales=("Weekly_Sales", "mean"),
@@ -68,7 +167,8 @@ store_stats = (
 )
 
 fuel_sales = (
-    analysis_df.groupby("Date", as_index=False)
+    analysis_df[["Date", "Weekly_Sales", "Fuel_Price"]]
+    .groupby("Date", as_index=False, sort=False)
     .agg(
         total_weekly_sales=("Weekly_Sales", "sum"),
         avg_fuel_price=("Fuel_Price", "mean"),
@@ -76,6 +176,10 @@ fuel_sales = (
     .sort_values("Date")
 )
 
+_summary_stats = analysis_df.agg(
+    {"Store": "nunique", "Weekly_Sales": "mean", "Date": ["min", "max"]}
+)
+
 summary_cards = [
     {
         "label": "Store-Weeks",
@@ -84,17 +188,20 @@ summary_cards = [
     },
     {
         "label": "Stores",
-        "value": f"{analysis_df['Store'].nunique()}",
+        "value": f"{int(_summary_stats.at['nunique', 'Store'])}",
         "subtext": "unique locations",
     },
     {
         "label": "Average Weekly Sales",
-        "value": f"${analysis_df['Weekly_Sales'].mean():,.0f}",
+        "value": f"${_summary_stats.at['mean', 'Weekly_Sales']:,.0f}",
         "subtext": "per store-week",
     },
     {
         "label": "Date Range",
-        "value": f"{analysis_df['Date'].min():%b %Y} – {analysis_df['Date'].max():%b %Y}",
+        "value": (
+            f"{_summary_stats.at['min', 'Date']:%b %Y} – "
+            f"{_summary_stats.at['max', 'Date']:%b %Y}"
+        ),
         "subtext": "full coverage",
     },
 ]
@@ -119,6 +226,30 @@ def build_holiday_fig() -> go.Figure:
     return fig
 
 
+def build_store_highlight(selected_store: int | None) -> go.Scattergl:
+    """Star marker for the selected store; empty if the store is unknown."""
+    x: List[float] = []
+    y: List[float] = []
+    if selected_store is not None and selected_store in store_stats["Store"].values:
+        row = store_stats[store_stats["Store"] == selected_store].iloc[0]
+        x, y = [float(row["avg_unemployment"])], [float(row["avg_weekly_sales"])]
+    return go.Scattergl(
+        x=x,
+        y=y,
+        mode="markers+text",
+        text=[f"Store {selected_store}"] if x else [],
+        textposition="bottom center",
+        marker=dict(
+            size=16,
+            color="crimson",
+            symbol="star",
+            line=dict(color="black", width=1),
+        ),
+        name=f"Store {selected_store}",
+        showlegend=False,
+    )
+
+
 def build_store_fig(selected_store: int | None) -> go.Figure:
     fig = px.scatter(
         store_stats,
@@ -132,60 +263,39 @@ def build_store_fig(selected_store: int | None) -> go.Figure:
             "avg_cpi": "Avg. CPI",
         },
         title="Store-Level View: Does Unemployment Suppress Sales?",
+        render_mode="webgl",
     )
     fig.update_traces(marker=dict(color="#4C78A8", opacity=0.65, line=dict(width=0)))
-
-    if selected_store is not None and selected_store in store_stats["Store"].values:
-        row = store_stats[store_stats["Store"] == selected_store].iloc[0]
-        fig.add_trace(
-            go.Scatter(
-                x=[row["avg_unemployment"]],
-                y=[row["avg_weekly_sales"]],
-                mode="markers+text",
-                text=[f"Store {selected_store}"],
-                textposition="bottom center",
-                marker=dict(
-                    size=16,
-                    color="crimson",
-                    symbol="star",
-                    line=dict(color="black", width=1),
-                ),
-                name=f"Store {selected_store}",
-                showlegend=False,
-            )
-        )
+    # Always the second trace, so the clientside callback can swap it in place.
+    fig.add_trace(build_store_highlight(selected_store))
     return fig
 
 
 def build_cpi_fig(flag: str) -> go.Figure:
-    if flag == "holiday":
-        subset = analysis_df[analysis_df["Holiday_Flag"] == 1]
-        title = "Holiday Weeks"
-    elif flag == "non_holiday":
-        subset = analysis_df[analysis_df["Holiday_Flag"] == 0]
-        title = "Non-Holiday Weeks"
-    else:
-        subset = analysis_df
-        title = "All Weeks"
+    if flag not in _CPI_SUBSETS:
+        flag = "all"
+    title = _CPI_TITLES[flag]
 
     fig = px.scatter(
-        subset,
+        _CPI_SAMPLES[flag],
         x="CPI",
         y="Weekly_Sales",
         color="Is_Holiday_Week",
         color_discrete_map={"Holiday Weeks": "#E45756", "Non-Holiday Weeks": "#4C78A8"},
         opacity=0.6,
         title=f"CPI vs. Weekly Sales · {title}",
+        render_mode="webgl",
     )
     fig.update_layout(
+        uirevision="cpi-scatter",
         legend_title="Week Type",
         xaxis_title="Consumer Price Index",
         yaxis_title="Weekly Sales ($)",
     )
 
-    if not subset.empty:
-        coeffs = np.polyfit(subset["CPI"], subset["Weekly_Sales"], 1)
-        x_vals = np.linspace(subset["CPI"].min(), subset["CPI"].max(), 50)
+    if flag in _TRENDS:
+        coeffs, x_min, x_max = _TRENDS[flag]
+        x_vals = np.linspace(x_min, x_max, 50)
         y_vals = coeffs[0] * x_vals + coeffs[1]
         fig.add_trace(
             go.Scatter(
@@ -237,8 +347,31 @@ def build_fuel_fig() -> go.Figure:
     return fig
 
 
+# The holiday and fuel charts never change, so convert them to plain dicts
+# once at import.
+_HOLIDAY_FIG_JSON = build_holiday_fig().to_plotly_json()
+_FUEL_FIG_JSON = build_fuel_fig().to_plotly_json()
+
+# Only three CPI filters exist, so build every variant up front; the callback
+# is a dict lookup.
+_CPI_FIG_JSON: Dict[str, dict] = {
+    flag: build_cpi_fig(flag).to_plotly_json() for flag in _CPI_SUBSETS
+}
+
+# The store chart is rendered in full once; later selections swap the
+# highlight trace in the browser from this per-store lookup.
+_DEFAULT_STORE = int(store_stats["Store"].min())
+_STORE_FIG_JSON = build_store_fig(_DEFAULT_STORE).to_plotly_json()
+_STORE_HIGHLIGHTS: Dict[str, dict] = {
+    str(store): build_store_highlight(int(store)).to_plotly_json()
+    for store in store_stats["Store"]
+}
+
+
 app = Dash(__name__)
 app.title = "Walmart Sales Dashboard"
+# WSGI entry point for Gunicorn (see module docstring).
+server = app.server
 
 app.layout = html.Div(
     [
@@ -268,7 +401,7 @@ app.layout = html.Div(
                         html.H4("Holiday Performance"),
                         dcc.Graph(
                             id="holiday-sales",
-                            figure=build_holiday_fig(),
+                            figure=_HOLIDAY_FIG_JSON,
                             config={"displayModeBar": False},
                         ),
                     ],
@@ -283,10 +416,11 @@ app.layout = html.Div(
                                 {"label": f"Store {store}", "value": int(store)}
                                 for store in sorted(store_stats["Store"].unique())
                             ],
-                            value=int(store_stats["Store"].iloc[0]),
+                            value=_DEFAULT_STORE,
                             clearable=False,
                         ),
-                        dcc.Graph(id="store-unemployment"),
+                        dcc.Graph(id="store-unemployment", figure=_STORE_FIG_JSON),
+                        dcc.Store(id="store-highlights", data=_STORE_HIGHLIGHTS),
                     ],
                     className="chart-card",
                 ),
@@ -317,7 +451,7 @@ app.layout = html.Div(
                         html.H4("Fuel Price vs. Total Sales"),
                         dcc.Graph(
                             id="fuel-sales",
-                            figure=build_fuel_fig(),
+                            figure=_FUEL_FIG_JSON,
                         ),
                     ],
                     className="chart-card",
@@ -339,14 +473,35 @@ app.layout = html.Div(
 )
 
 
-@app.callback(Output("store-unemployment", "figure"), Input("store-dropdown", "value"))
-def update_store_chart(selected_store: int) -> go.Figure:
-    return build_store_fig(selected_store)
+# Swapping the store highlight runs entirely in the browser: no round-trip,
+# no Python, no re-serialization of the base scatter.
+app.clientside_callback(
+    """
+    function(selectedStore, highlights, figure) {
+        const highlight = highlights[String(selectedStore)];
+        if (!figure || !highlight) {
+            return window.dash_clientside.no_update;
+        }
+        const data = figure.data.slice();
+        data[1] = highlight;
+        return Object.assign({}, figure, {data: data});
+    }
+    """,
+    Output("store-unemployment", "figure"),
+    Input("store-dropdown", "value"),
+    Input("store-highlights", "data"),
+    State("store-unemployment", "figure"),
+    prevent_initial_call=True,
+)
 
 
 @app.callback(Output("cpi-scatter", "figure"), Input("cpi-filter", "value"))
-def update_cpi_chart(flag: str) -> go.Figure:
-    return build_cpi_fig(flag)
+def update_cpi_chart(flag: str) -> dict:
+    # Inputs are not validated server-side; anything unexpected shows all weeks.
+    if not isinstance(flag, str) or flag not in _CPI_FIG_JSON:
+        flag = "all"
+    return _CPI_FIG_JSON[flag]
+
 
 # Simple inline CSS so the dashboard looks decent without external assets.
 app.index_string = """